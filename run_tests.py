@@ -3,31 +3,66 @@
 Test runner script for the Mergington High School Activities API
 """
 
+import glob
+import os
 import subprocess
 import sys
 
+import pytest
 
-def run_tests(with_coverage=True, verbose=True):
-    """Run the test suite with optional coverage reporting."""
-    cmd = ["python", "-m", "pytest", "tests/"]
+
+def run_tests(with_coverage=False, verbose=True, parallel=True, use_cache=False,
+              in_subprocess=False):
+    """Run the test suite with optional coverage reporting and parallel workers.
+
+    Tests run in the current interpreter via ``pytest.main`` unless
+    ``in_subprocess`` is set, in which case a fresh Python process is used.
+    """
+    args = ["tests/"]
     
     if verbose:
-        cmd.append("-v")
+        args.append("-v")
+    
+    # Leave a couple of cores free. loadfile keeps each test file on one
+    # worker, so more workers than test files would only sit idle. This is
+    # tuned for a larger suite: at today's size xdist startup outweighs the
+    # gain, and --no-parallel is usually faster.
+    test_files = len(glob.glob(os.path.join("tests", "test_*.py")))
+    workers = min((os.cpu_count() or 1) - 2, test_files) if parallel else 0
+    
+    if workers >= 2:
+        args.extend(["-n", str(workers), "--dist=loadfile"])
+    else:
+        # A single worker pays xdist startup for no parallelism; run in-process
+        args.extend(["-n", "0"])
     
     if with_coverage:
-        cmd.extend(["--cov=src", "--cov-report=term-missing"])
+        args.extend(["--cov=src", "--cov-report=term-missing"])
     
-    print(f"Running command: {' '.join(cmd)}")
-    print("=" * 80)
+    if not use_cache:
+        args.extend(["-p", "no:cacheprovider"])
+    
+    if in_subprocess:
+        cmd = [sys.executable, "-m", "pytest"] + args
+        print(f"Running command: {' '.join(cmd)}")
+        print("=" * 80)
+        result = subprocess.run(cmd, cwd=".")
+        return result.returncode
     
-    result = subprocess.run(cmd, cwd=".")
-    return result.returncode
+    print(f"Running pytest.main({args})")
+    print("=" * 80)
+    return int(pytest.main(args))
 
 
 if __name__ == "__main__":
     # Parse command line arguments
-    with_coverage = "--no-cov" not in sys.argv
+    with_coverage = "--cov" in sys.argv
     verbose = "--quiet" not in sys.argv
+    parallel = "--no-parallel" not in sys.argv
+    use_cache = "--cache" in sys.argv
+    in_subprocess = "--subprocess" in sys.argv
     
-    exit_code = run_tests(with_coverage=with_coverage, verbose=verbose)
+    exit_code = run_tests(with_coverage=with_coverage, verbose=verbose,
+                          parallel=parallel, use_cache=use_cache,
+                          in_subprocess=in_subprocess)
     sys.exit(exit_code)
\ No newline at end of file
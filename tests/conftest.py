@@ -4,13 +4,73 @@ Pytest configuration and fixtures for the FastAPI application tests.
 
 import pytest
 from fastapi.testclient import TestClient
-from src.app import app
+from src.app import app as _app, activities
 
 
-@pytest.fixture
+# Initial state of the in-memory activities database
+_ORIGINAL_ACTIVITIES = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    }
+}
+
+
+def _snapshot():
+    """Return a fresh copy of the initial activities with independent participant lists."""
+    return {
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in _ORIGINAL_ACTIVITIES.items()
+    }
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
+    """Create a test client shared by all tests in the session.
+
+    Entering the client runs the application lifespan once for the whole
+    session. The client holds no per-test state; the activities database is
+    reset separately by ``reset_activities``.
+    """
+    with TestClient(_app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def app():
+    """Provide the FastAPI application."""
+    return _app
+
+
+@pytest.fixture
+def app_state():
+    """Provide the application's in-memory activities database."""
+    return activities
+
+
+@pytest.fixture(scope="session")
+def static_contents(client):
+    """Fetch each static asset once per session, keyed by file name."""
+    contents = {}
+    for name in ["index.html", "styles.css", "app.js"]:
+        response = client.get(f"/static/{name}")
+        assert response.status_code == 200, f"/static/{name} returned {response.status_code}"
+        contents[name] = response.text
+    return contents
 
 
 @pytest.fixture
@@ -27,36 +87,9 @@ def sample_activity():
 @pytest.fixture(autouse=True)
 def reset_activities():
     """Reset activities to initial state before each test."""
-    from src.app import activities
-    
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Reset to known state before test
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Restore original state after test
-    activities.clear()
-    activities.update(original_activities)
\ No newline at end of file
+    # Reset to known state before test; the next test resets again, so no
+    # restore is needed afterwards. Read-only tests leave the data equal to
+    # the initial state, so the rebuild can be skipped for the following test.
+    if activities != _ORIGINAL_ACTIVITIES:
+        activities.clear()
+        activities.update(_snapshot())
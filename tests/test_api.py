@@ -4,7 +4,6 @@ Test cases for the FastAPI application endpoints.
 
 import pytest
 from fastapi.testclient import TestClient
-from src.app import app, activities
 
 
 class TestRootEndpoint:
@@ -58,7 +57,7 @@ class TestActivitiesEndpoint:
 class TestSignupEndpoint:
     """Test cases for the activity signup endpoint."""
     
-    def test_signup_for_existing_activity_success(self, client):
+    def test_signup_for_existing_activity_success(self, client, app_state):
         """Test successful signup for an existing activity."""
         response = client.post("/activities/Chess Club/signup?email=newstudent@mergington.edu")
         
@@ -67,9 +66,7 @@ class TestSignupEndpoint:
         assert data["message"] == "Signed up newstudent@mergington.edu for Chess Club"
         
         # Verify the participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Chess Club"]["participants"]
+        assert "newstudent@mergington.edu" in app_state["Chess Club"]["participants"]
     
     def test_signup_for_nonexistent_activity(self, client):
         """Test signup for an activity that doesn't exist."""
@@ -91,18 +88,12 @@ class TestSignupEndpoint:
         data = response2.json()
         assert data["detail"] == "Student already signed up for this activity"
     
-    def test_signup_activity_full(self, client):
+    def test_signup_activity_full(self, client, app_state):
         """Test signup when activity is at max capacity."""
-        # Fill up the Chess Club (max 12 participants)
-        # First, get current participants count
-        activities_response = client.get("/activities")
-        chess_participants = len(activities_response.json()["Chess Club"]["participants"])
-        
-        # Add participants until we reach the limit
-        for i in range(12 - chess_participants):
-            response = client.post(f"/activities/Chess Club/signup?email=student{i}@mergington.edu")
-            if response.status_code != 200:
-                break
+        # Fill up the Chess Club (max 12 participants) directly in the data layer
+        app_state["Chess Club"]["participants"] = [
+            f"filler{i}@mergington.edu" for i in range(12)
+        ]
         
         # Now try to add one more - should fail
         response = client.post("/activities/Chess Club/signup?email=overflow@mergington.edu")
@@ -110,7 +101,7 @@ class TestSignupEndpoint:
         data = response.json()
         assert data["detail"] == "Activity is full"
     
-    def test_signup_url_encoding(self, client):
+    def test_signup_url_encoding(self, client, app_state):
         """Test signup with URL-encoded activity names."""
         activity_name = "Programming Class"
         encoded_name = "Programming%20Class"
@@ -119,15 +110,13 @@ class TestSignupEndpoint:
         assert response.status_code == 200
         
         # Verify participant was added to the correct activity
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "encoder@mergington.edu" in activities_data["Programming Class"]["participants"]
+        assert "encoder@mergington.edu" in app_state["Programming Class"]["participants"]
 
 
 class TestUnregisterEndpoint:
     """Test cases for the activity unregister endpoint."""
     
-    def test_unregister_existing_participant(self, client):
+    def test_unregister_existing_participant(self, client, app_state):
         """Test successful unregistration of an existing participant."""
         # First, sign up a participant
         signup_response = client.post("/activities/Chess Club/signup?email=tobedeleted@mergington.edu")
@@ -141,9 +130,7 @@ class TestUnregisterEndpoint:
         assert data["message"] == "Unregistered tobedeleted@mergington.edu from Chess Club"
         
         # Verify the participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "tobedeleted@mergington.edu" not in activities_data["Chess Club"]["participants"]
+        assert "tobedeleted@mergington.edu" not in app_state["Chess Club"]["participants"]
     
     def test_unregister_nonexistent_activity(self, client):
         """Test unregistration from an activity that doesn't exist."""
@@ -161,29 +148,26 @@ class TestUnregisterEndpoint:
         data = response.json()
         assert data["detail"] == "Student is not registered for this activity"
     
-    def test_unregister_existing_participant_from_default_data(self, client):
+    def test_unregister_existing_participant_from_default_data(self, client, app_state):
         """Test unregistering a participant who was in the default data."""
         # Unregister michael@mergington.edu who should be in Chess Club by default
         response = client.delete("/activities/Chess Club/unregister?email=michael@mergington.edu")
         assert response.status_code == 200
         
         # Verify they were removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" not in activities_data["Chess Club"]["participants"]
+        assert "michael@mergington.edu" not in app_state["Chess Club"]["participants"]
 
 
 class TestIntegrationScenarios:
     """Integration test scenarios combining multiple operations."""
     
-    def test_signup_and_unregister_workflow(self, client):
+    def test_signup_and_unregister_workflow(self, client, app_state):
         """Test a complete signup and unregister workflow."""
         email = "workflow@mergington.edu"
         activity = "Programming Class"
         
         # 1. Initial state - participant should not be registered
-        activities_response = client.get("/activities")
-        initial_participants = activities_response.json()[activity]["participants"]
+        initial_participants = list(app_state[activity]["participants"])
         assert email not in initial_participants
         
         # 2. Sign up
@@ -191,8 +175,7 @@ class TestIntegrationScenarios:
         assert signup_response.status_code == 200
         
         # 3. Verify signup
-        activities_response = client.get("/activities")
-        after_signup_participants = activities_response.json()[activity]["participants"]
+        after_signup_participants = app_state[activity]["participants"]
         assert email in after_signup_participants
         assert len(after_signup_participants) == len(initial_participants) + 1
         
@@ -201,12 +184,11 @@ class TestIntegrationScenarios:
         assert unregister_response.status_code == 200
         
         # 5. Verify unregistration
-        activities_response = client.get("/activities")
-        final_participants = activities_response.json()[activity]["participants"]
+        final_participants = app_state[activity]["participants"]
         assert email not in final_participants
         assert len(final_participants) == len(initial_participants)
     
-    def test_multiple_activities_signup(self, client):
+    def test_multiple_activities_signup(self, client, app_state):
         """Test signing up for multiple different activities."""
         email = "multisport@mergington.edu"
         activities_to_join = ["Chess Club", "Programming Class", "Gym Class"]
@@ -216,8 +198,5 @@ class TestIntegrationScenarios:
             assert response.status_code == 200
         
         # Verify participant is in all activities
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        
         for activity in activities_to_join:
-            assert email in activities_data[activity]["participants"]
\ No newline at end of file
+            assert email in app_state[activity]["participants"]
\ No newline at end of file
@@ -2,54 +2,52 @@
 Test cases for edge cases, validation, and error handling.
 """
 
+import asyncio
+import urllib.parse
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
-from src.app import app
+
+
+# Inputs that are constant across the session
+SPECIAL_EMAIL = "test+special.email@mergington.edu"
+ENCODED_SPECIAL_EMAIL = urllib.parse.quote(SPECIAL_EMAIL)
+LONG_EMAIL = "a" * 100 + "@mergington.edu"
 
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
     
-    def test_empty_email_signup(self, client):
+    def test_empty_email_signup(self, client, app_state):
         """Test signup with empty email parameter."""
         response = client.post("/activities/Chess Club/signup?email=")
         # The API currently accepts empty emails, so we test the actual behavior
         assert response.status_code == 200
         
         # Verify empty email was added to participants
-        activities_response = client.get("/activities")
-        participants = activities_response.json()["Chess Club"]["participants"]
-        assert "" in participants
+        assert "" in app_state["Chess Club"]["participants"]
     
     def test_missing_email_parameter(self, client):
         """Test signup without email parameter."""
         response = client.post("/activities/Chess Club/signup")
         assert response.status_code == 422  # Validation error for missing required parameter
     
-    def test_special_characters_in_email(self, client):
+    def test_special_characters_in_email(self, client, app_state):
         """Test signup with special characters in email."""
-        # URL encode the email to preserve special characters
-        import urllib.parse
-        special_email = "test+special.email@mergington.edu"
-        encoded_email = urllib.parse.quote(special_email)
-        
-        response = client.post(f"/activities/Chess Club/signup?email={encoded_email}")
+        # The email is URL encoded to preserve special characters
+        response = client.post(f"/activities/Chess Club/signup?email={ENCODED_SPECIAL_EMAIL}")
         assert response.status_code == 200
         
         # Verify the email was stored correctly
-        activities_response = client.get("/activities")
-        participants = activities_response.json()["Chess Club"]["participants"]
-        assert special_email in participants
+        assert SPECIAL_EMAIL in app_state["Chess Club"]["participants"]
     
-    def test_very_long_email(self, client):
+    def test_very_long_email(self, client, app_state):
         """Test signup with a very long email address."""
-        long_email = "a" * 100 + "@mergington.edu"
-        response = client.post(f"/activities/Chess Club/signup?email={long_email}")
+        response = client.post(f"/activities/Chess Club/signup?email={LONG_EMAIL}")
         assert response.status_code == 200
         
-        activities_response = client.get("/activities")
-        participants = activities_response.json()["Chess Club"]["participants"]
-        assert long_email in participants
+        assert LONG_EMAIL in app_state["Chess Club"]["participants"]
     
     def test_activity_name_with_spaces_and_special_chars(self, client):
         """Test operations with activity names containing spaces."""
@@ -69,64 +67,56 @@ class TestEdgeCases:
 class TestDataConsistency:
     """Test data consistency and state management."""
     
-    def test_participant_count_consistency(self, client):
+    def test_participant_count_consistency(self, client, app_state):
         """Test that participant counts remain consistent."""
         # Get initial state
-        initial_response = client.get("/activities")
-        initial_data = initial_response.json()
-        initial_count = len(initial_data["Chess Club"]["participants"])
+        initial_count = len(app_state["Chess Club"]["participants"])
         
         # Add a participant
         client.post("/activities/Chess Club/signup?email=consistency@mergington.edu")
         
         # Check count increased by 1
-        after_signup_response = client.get("/activities")
-        after_signup_data = after_signup_response.json()
-        after_signup_count = len(after_signup_data["Chess Club"]["participants"])
+        after_signup_count = len(app_state["Chess Club"]["participants"])
         assert after_signup_count == initial_count + 1
         
         # Remove the participant
         client.delete("/activities/Chess Club/unregister?email=consistency@mergington.edu")
         
         # Check count is back to original
-        final_response = client.get("/activities")
-        final_data = final_response.json()
-        final_count = len(final_data["Chess Club"]["participants"])
+        final_count = len(app_state["Chess Club"]["participants"])
         assert final_count == initial_count
     
-    def test_concurrent_signup_simulation(self, client):
-        """Simulate concurrent signups to test for race conditions."""
+    @pytest.mark.asyncio
+    async def test_concurrent_signups(self, app, app_state):
+        """Test that concurrent signups are all recorded without lost updates."""
         emails = [f"concurrent{i}@mergington.edu" for i in range(5)]
         
-        # Sign up multiple participants
-        for email in emails:
-            response = client.post(f"/activities/Chess Club/signup?email={email}")
-            assert response.status_code == 200
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            responses = await asyncio.gather(*[
+                async_client.post(f"/activities/Chess Club/signup?email={email}")
+                for email in emails
+            ])
         
-        # Verify all participants were added
-        activities_response = client.get("/activities")
-        participants = activities_response.json()["Chess Club"]["participants"]
+        assert all(response.status_code == 200 for response in responses)
         
+        # Verify all participants were added exactly once
+        participants = app_state["Chess Club"]["participants"]
         for email in emails:
-            assert email in participants
+            assert participants.count(email) == 1
 
 
 class TestHTTPMethods:
     """Test correct HTTP method usage and restrictions."""
     
-    def test_get_method_on_signup_endpoint(self, client):
-        """Test that GET method is not allowed on signup endpoint."""
-        response = client.get("/activities/Chess Club/signup?email=test@mergington.edu")
-        assert response.status_code == 405  # Method Not Allowed
-    
-    def test_post_method_on_unregister_endpoint(self, client):
-        """Test that POST method is not allowed on unregister endpoint."""
-        response = client.post("/activities/Chess Club/unregister?email=test@mergington.edu")
-        assert response.status_code == 405  # Method Not Allowed
-    
-    def test_put_method_on_activities_endpoint(self, client):
-        """Test that PUT method is not allowed on activities endpoint."""
-        response = client.put("/activities")
+    @pytest.mark.parametrize("method,url", [
+        ("GET", "/activities/Chess Club/signup?email=test@mergington.edu"),
+        ("POST", "/activities/Chess Club/unregister?email=test@mergington.edu"),
+        ("PUT", "/activities"),
+    ])
+    def test_method_not_allowed(self, client, method, url):
+        """Test that endpoints reject HTTP methods they do not support."""
+        response = client.request(method, url)
         assert response.status_code == 405  # Method Not Allowed
 
 
@@ -144,17 +134,18 @@ class TestResponseFormats:
         response = client.post("/activities/Chess Club/signup?email=format@mergington.edu")
         assert response.status_code == 200
         
-        data = response.json()
-        assert "message" in data
-        assert isinstance(data["message"], str)
-        assert "format@mergington.edu" in data["message"]
-        assert "Chess Club" in data["message"]
+        # Substring checks on the raw body; no need to decode the JSON
+        body = response.text
+        assert '"message"' in body
+        assert "format@mergington.edu" in body
+        assert "Chess Club" in body
     
     def test_error_response_format(self, client):
         """Test the format of error responses."""
         response = client.post("/activities/Nonexistent/signup?email=error@mergington.edu")
         assert response.status_code == 404
         
+        # The type of "detail" is part of the error shape, so decode the JSON
         data = response.json()
         assert "detail" in data
         assert isinstance(data["detail"], str)
@@ -4,31 +4,23 @@ Test cases for static file serving and frontend functionality.
 
 import pytest
 from fastapi.testclient import TestClient
-from src.app import app
 
 
 class TestStaticFiles:
     """Test cases for static file serving."""
     
-    def test_static_index_html_accessible(self, client):
-        """Test that static index.html is accessible."""
-        response = client.get("/static/index.html")
-        assert response.status_code == 200
-        assert "text/html" in response.headers.get("content-type", "")
-    
-    def test_static_css_accessible(self, client):
-        """Test that static CSS file is accessible."""
-        response = client.get("/static/styles.css")
-        assert response.status_code == 200
-        assert "text/css" in response.headers.get("content-type", "")
-    
-    def test_static_js_accessible(self, client):
-        """Test that static JavaScript file is accessible."""
-        response = client.get("/static/app.js")
-        assert response.status_code == 200
+    @pytest.mark.parametrize("path,content_types", [
+        ("/static/index.html", ["text/html"]),
+        ("/static/styles.css", ["text/css"]),
         # JavaScript might be served as application/javascript or text/javascript
+        ("/static/app.js", ["javascript", "text/plain"]),
+    ])
+    def test_static_asset_accessible(self, client, path, content_types):
+        """Test that each static asset is served with a suitable content type."""
+        response = client.get(path)
+        assert response.status_code == 200
         content_type = response.headers.get("content-type", "")
-        assert any(js_type in content_type for js_type in ["javascript", "text/plain"])
+        assert any(expected in content_type for expected in content_types)
     
     def test_root_redirects_to_static(self, client):
         """Test that root URL redirects to static content."""
@@ -44,10 +36,9 @@ class TestStaticFiles:
 class TestHTMLContent:
     """Test HTML content validation."""
     
-    def test_index_html_contains_required_elements(self, client):
+    def test_index_html_contains_required_elements(self, static_contents):
         """Test that index.html contains the required form elements."""
-        response = client.get("/static/index.html")
-        content = response.text
+        content = static_contents["index.html"]
         
         # Check for essential form elements
         assert 'id="signup-form"' in content
@@ -59,12 +50,19 @@ class TestHTMLContent:
         assert 'href="styles.css"' in content
         assert 'src="app.js"' in content
     
-    def test_css_contains_activity_styles(self, client):
+    def test_css_contains_activity_styles(self, static_contents):
         """Test that CSS contains styles for activity elements."""
-        response = client.get("/static/styles.css")
-        content = response.text
+        content = static_contents["styles.css"]
         
         # Check for activity-related CSS classes
         assert ".activity-card" in content
         assert ".participants-list" in content
-        assert ".delete-participant" in content
\ No newline at end of file
+        assert ".delete-participant" in content
+    
+    def test_js_calls_activity_endpoints(self, static_contents):
+        """Test that the JavaScript talks to the activity API endpoints."""
+        content = static_contents["app.js"]
+        
+        assert 'fetch("/activities")' in content
+        assert "/signup?email=" in content
+        assert "/unregister?email=" in content